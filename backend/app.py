@@ -1,26 +1,50 @@
 import os
-import json
+import re
+import time
+import zlib
+import orjson
+import queue
+import atexit
 import logging
-from flask import Flask, jsonify, request
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
-from crew_manager import CrewManager
-from crewai import Crew, Process
+from crew_manager import PERSONAS_DIR, CrewManager, get_llm, llm_slot
+from prompt_cache import PromptCache
+from json_provider import OrjsonProvider
+from pydantic import ValidationError
+from schemas import MAX_BATCH_PERSONAS, MAX_BATCH_QUESTIONS, BatchInteractionIn, CustomPersonaIn, FocusGroupIn, FocusGroupRoundIn, GroupDiscussionIn, PersonaIn, SimpleInteractionIn
 from datetime import datetime
 
 load_dotenv()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Never pretty-print responses, even in debug mode
+app.json.compact = True
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-# Configure logging for the application
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()  # This ensures logs go to console/terminal
-    ]
-)
+# Saved persona JSON files next to this module, created once here rather than checked per request
+os.makedirs(PERSONAS_DIR, exist_ok=True)
+# Absolute root with a trailing separator, so prefix checks can't match siblings like "personas_old"
+_PERSONAS_ROOT = os.path.abspath(PERSONAS_DIR) + os.sep
+
+# Configure logging for the application. Request threads only enqueue
+# records; a background listener formats and writes them to the console.
+# Skipped when the root logger is already set up, e.g. when this module is
+# imported a second time as both __main__ and app.
+if not logging.getLogger().handlers:
+    _console_handler = logging.StreamHandler()
+    _console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
+    _queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+    _log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 # Set Flask's logger to INFO level as well
 app.logger.setLevel(logging.INFO)
@@ -30,43 +54,172 @@ gemini_api_key = os.getenv("GEMINI_API_KEY")
 if not gemini_api_key:
     raise ValueError("GEMINI_API_KEY environment variable is required")
 
-crew_manager = CrewManager(gemini_api_key)
+crew_manager = CrewManager.get(gemini_api_key)
+
+# Generated insight text keyed by the analysis prompt
+insights_cache = PromptCache(int(os.getenv("INSIGHTS_CACHE_SIZE", "128")))
 
 # Test log to confirm logging is working
 app.logger.info("MeshAI Backend started successfully - logging is configured!")
 
+# Anything other than word characters, spaces and hyphens is dropped from filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Stand-in details for session personas whose file no longer exists
+_UNKNOWN_PERSONA = {"name": "Unknown", "role": "Unknown Role", "avatar": "👤", "description": ""}
+
+def _safe_filename(name: str) -> str:
+    """Sanitize a display name for use as a filename stem"""
+    return _UNSAFE_FILENAME_CHARS.sub("", name).rstrip().replace(' ', '_')
+
+def _encode_json(data) -> bytes:
+    """Encode a body exactly as jsonify would, for responses cached or streamed as bytes"""
+    return app.json._dumpb(data, sort_keys=app.json.sort_keys)
+
+def _json_array_response(encoded_items) -> Response:
+    """Stream already-encoded JSON values as a JSON array without building the whole body"""
+    def generate():
+        yield b"["
+        for i, item in enumerate(encoded_items):
+            if i:
+                yield b","
+            yield item
+        yield b"]"
+    return Response(generate(), mimetype="application/json")
+
+def _read_persona_file(filepath: str):
+    """Parse one persona file, or None if it isn't valid JSON"""
+    try:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    except orjson.JSONDecodeError:
+        app.logger.warning(f"Could not parse JSON from {os.path.basename(filepath)}")
+        return None
+
+def _read_persona_files(personas_dir: str):
+    """Read every persona JSON file in personas_dir concurrently as (filename, data) pairs"""
+    with os.scandir(personas_dir) as entries:
+        filenames = [entry.name for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+    if not filenames:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(filenames))) as pool:
+        parsed = pool.map(_read_persona_file, [os.path.join(personas_dir, name) for name in filenames])
+        return [(name, data) for name, data in zip(filenames, parsed) if data is not None]
+
+# Parsed session files by path as ((st_mtime_ns, st_size), data)
+_session_cache = {}
+
+def _read_session_files(sessions_dir: str):
+    """Read every session JSON file in sessions_dir as (filename, data) pairs, re-parsing only changed files"""
+    sessions = []
+    seen = set()
+    with os.scandir(sessions_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            seen.add(entry.path)
+            st = entry.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _session_cache.get(entry.path)
+            if cached is None or cached[0] != stamp:
+                try:
+                    with open(entry.path, 'rb') as f:
+                        cached = (stamp, orjson.loads(f.read()))
+                except orjson.JSONDecodeError:
+                    app.logger.warning(f"Could not parse JSON from {entry.name}")
+                    continue
+                _session_cache[entry.path] = cached
+            sessions.append((entry.name, cached[1]))
+    
+    # Forget files that have since been removed
+    for path in [path for path in _session_cache if path not in seen]:
+        _session_cache.pop(path, None)
+    return sessions
+
+# Encoded get-sessions entries by filename as (parsed session, bytes); an
+# entry is stale once _read_session_files re-parses the file into a new dict
+_session_entries = {}
+
+def _session_entry(filename: str, session_data) -> bytes:
+    """Encode one get-sessions entry, reusing the bytes until the file changes"""
+    cached = _session_entries.get(filename)
+    if cached is None or cached[0] is not session_data:
+        cached = (session_data, _encode_json({
+            "filename": filename,
+            "metadata": session_data.get("metadata", {}),
+            "session_data": session_data.get("session_data", {})
+        }))
+        _session_entries[filename] = cached
+    return cached[1]
+
+# Serialized persona listings by endpoint as (mtime, body, etag), tagged with
+# the personas directory mtime they were built from
+_listing_cache = {}
+
+def _cached_listing(key: str, personas_dir: str, build):
+    """Serve a JSON listing derived from personas_dir, rebuilding it only when the directory changes"""
+    try:
+        mtime = os.stat(personas_dir).st_mtime_ns
+    except FileNotFoundError:
+        return jsonify([])
+    cached = _listing_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        body = _encode_json(build())
+        cached = (mtime, body, format(zlib.crc32(body), "08x"))
+        _listing_cache[key] = cached
+    
+    # Pollers that already hold this body get an empty 304 instead
+    response = Response(cached[1], mimetype="application/json")
+    response.set_etag(cached[2])
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+def _json_body():
+    """Decode the raw request body with orjson, or {} when it is empty"""
+    raw = request.get_data()
+    return orjson.loads(raw) if raw else {}
+
+def _validate_body(model):
+    """Parse and validate the raw JSON body in one pass, or None if it doesn't fit the schema"""
+    try:
+        return model.model_validate_json(request.get_data())
+    except ValidationError:
+        return None
+
 # Saving personas to /backend/personas
 @app.route("/save-persona", methods=["POST"])
 def save_persona():
-    new_persona = request.get_json()
+    payload = _validate_body(PersonaIn)
+    # Only fields the client actually sent are written to disk
+    new_persona = payload.model_dump(exclude_unset=True) if payload else None
 
     if not new_persona:
         return jsonify({"error": "No data provided"}), 400
 
-    # Create personas directory if it doesn't exist
-    personas_dir = "personas"
-    if not os.path.exists(personas_dir):
-        os.makedirs(personas_dir)
-
     # Generate a unique filename based on persona name
-    persona_name = new_persona.get("name", "unknown")
+    persona_name = payload.name
     # Sanitize the name for use as a filename
-    safe_name = "".join(c for c in persona_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_name = safe_name.replace(' ', '_')
+    safe_name = _safe_filename(persona_name)
     
-    # Add timestamp to ensure uniqueness
-    import time
-    timestamp = int(time.time())
+    # Add a nanosecond timestamp so rapid saves of the same name don't overwrite each other
+    timestamp = time.time_ns()
     filename = f"{safe_name}_{timestamp}.json"
-    filepath = os.path.join(personas_dir, filename)
+    filepath = os.path.join(PERSONAS_DIR, filename)
 
     try:
-        with open(filepath, 'w') as f:
-            json.dump(new_persona, f, indent=4)
+        # orjson encodes straight to UTF-8 bytes in one write
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(new_persona, option=orjson.OPT_INDENT_2))
+        # The directory mtime moved when the file was created, before its
+        # contents landed, so drop any listing built in between
+        _listing_cache.clear()
+        crew_manager.reload_personas()
         return jsonify({
             "message": "Persona saved successfully",
             "filename": filename,
-            "filepath": filepath
+            # Relative to the backend, as before, rather than exposing the server's absolute path
+            "filepath": os.path.join(os.path.basename(PERSONAS_DIR), filename)
         }), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -76,31 +229,20 @@ def save_persona():
 def display_personas_api():
     """Get all personas from the personas directory for display in focus-group"""
     try:
-        personas_dir = "personas"
-        if not os.path.exists(personas_dir):
-            return jsonify([])
-        
-        personas = []
-        for filename in os.listdir(personas_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(personas_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        persona_data = json.load(f)
-                        # Ensure the persona has an id field (use filename without extension as id)
-                        persona_id = filename.replace('.json', '')
-                        persona_data['id'] = persona_id
-                        
-                        # Ensure required fields exist with defaults
-                        if 'traits' not in persona_data:
-                            persona_data['traits'] = [persona_data.get('description', 'General')]
-                        
-                        personas.append(persona_data)
-                except json.JSONDecodeError:
-                    app.logger.warning(f"Could not parse JSON from {filename}")
-                    continue
+        def build():
+            personas = []
+            for filename, persona_data in _read_persona_files(PERSONAS_DIR):
+                # Ensure the persona has an id field (use filename without extension as id)
+                persona_data['id'] = filename.replace('.json', '')
+                
+                # Ensure required fields exist with defaults
+                if 'traits' not in persona_data:
+                    persona_data['traits'] = [persona_data.get('description', 'General')]
+                
+                personas.append(persona_data)
+            return personas
         
-        return jsonify(personas)
+        return _cached_listing("display-personas", PERSONAS_DIR, build)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -121,16 +263,22 @@ def get_personas():
 def simple_interaction():
     """Handle simple Q&A interaction with selected personas"""
     try:
-        data = request.json
-        question = data.get("question", "")
-        selected_personas = data.get("personas", [])
-        
-        if not question or not selected_personas:
+        payload = _validate_body(SimpleInteractionIn)
+        if payload is None:
             return jsonify({"error": "Question and personas are required"}), 400
+        question, selected_personas = payload.question, payload.personas
+        
+        # Clients asking for NDJSON get one line per persona as each finishes
+        if request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"]) == "application/x-ndjson":
+            reactions = crew_manager.iter_simple_interaction(question, selected_personas)
+            return Response(
+                (app.json.dumps(reaction) + "\n" for reaction in reactions),
+                mimetype="application/x-ndjson"
+            )
         
         reactions = crew_manager.run_simple_interaction(question, selected_personas)
         
-        app.logger.info(f"Reactions: {reactions}")
+        app.logger.debug("Reactions: %s", reactions)
         
         return jsonify({
             "question": question,
@@ -141,23 +289,40 @@ def simple_interaction():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route("/api/batch-interaction", methods=["POST"])
+def batch_interaction():
+    """Ask several questions to the selected personas in one concurrent batch"""
+    try:
+        payload = _validate_body(BatchInteractionIn)
+        if payload is None:
+            return jsonify({"error": f"Questions and personas are required (at most {MAX_BATCH_QUESTIONS} questions and {MAX_BATCH_PERSONAS} personas)"}), 400
+        questions, selected_personas = payload.questions, payload.personas
+        
+        results = crew_manager.run_batch_interaction(questions, selected_personas)
+        
+        return jsonify({
+            "results": results,
+            "timestamp": crew_manager._get_timestamp()
+        })
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route("/api/group-discussion", methods=["POST"])
 def group_discussion():
     """Handle group discussion between personas"""
     try:
-        data = request.json
-        question = data.get("question", "")
-        selected_personas = data.get("personas", [])
-        initial_reactions = data.get("initial_reactions", [])
-        
-        if not question or not selected_personas:
+        payload = _validate_body(GroupDiscussionIn)
+        if payload is None:
             return jsonify({"error": "Question and personas are required"}), 400
+        question, selected_personas = payload.question, payload.personas
+        initial_reactions = payload.initial_reactions
         
         discussion_messages = crew_manager.run_group_discussion(
             question, selected_personas, initial_reactions
         )
         
-        app.logger.info(f"Discussion Messages: {discussion_messages}")
+        app.logger.debug("Discussion Messages: %s", discussion_messages)
         
         return jsonify({
             "question": question,
@@ -172,20 +337,28 @@ def group_discussion():
 def focus_group_simulation():
     """Handle focus group simulation"""
     try:
-        data = request.json
-        app.logger.info(f"Focus Group Data: {data}")
-        campaign_description = data.get("campaign_description", "")
-        selected_personas = data.get("personas", [])
-        session_goals = data.get("goals", [])
-        
-        if not campaign_description or not selected_personas:
+        payload = _validate_body(FocusGroupIn)
+        if payload is None:
             return jsonify({"error": "Campaign description and personas are required"}), 400
+        app.logger.debug("Focus Group Data: %s", payload)
+        campaign_description = payload.campaign_description
+        selected_personas, session_goals = payload.personas, payload.goals
+        
+        # Clients asking for NDJSON get one event per line as each phase completes
+        if request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"]) == "application/x-ndjson":
+            events = crew_manager.iter_focus_group_simulation(
+                campaign_description, selected_personas, session_goals
+            )
+            return Response(
+                (app.json.dumps(event) + "\n" for event in events),
+                mimetype="application/x-ndjson"
+            )
         
         result = crew_manager.run_focus_group_simulation(
             campaign_description, selected_personas, session_goals
         )
         
-        app.logger.info(f"Focus Group Result: {result}")
+        app.logger.debug("Focus Group Result: %s", result)
         
         return jsonify(result)
         
@@ -196,80 +369,24 @@ def focus_group_simulation():
 def focus_group_start():
     """Start focus group with initial reactions"""
     try:
-        data = request.json
-        app.logger.info(f"Focus Group Start Data: {data}")
-        campaign_description = data.get("campaign_description", "")
-        selected_personas = data.get("personas", [])
-        session_goals = data.get("goals", [])
-        
-        if not campaign_description or not selected_personas:
+        payload = _validate_body(FocusGroupIn)
+        if payload is None:
             return jsonify({"error": "Campaign description and personas are required"}), 400
-        
-        # Only run Phase 1: Initial Reactions
-        initial_reactions = []
-        
-        for persona_id in selected_personas:
-            agent_name = persona_id.replace('-', '_')
-            agent = crew_manager.create_agent(agent_name)
-            
-            if not agent:
-                app.logger.error(f"Failed to create agent for {agent_name}")
-                continue
-            
-            task = crew_manager.create_task(
-                'focus_group_initial_task',
-                agent,
-                campaign_description=campaign_description,
-                session_goals=", ".join(session_goals),
-                agent_name=agent_name
-            )
-            
-            if not task:
-                app.logger.error(f"Failed to create task for {agent_name}")
-                continue
-            
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
-            
-            try:
-                result = crew.kickoff()
-                response_text = str(result)
-                app.logger.info(f"Initial Reaction for {persona_id}: {len(response_text)} characters")
-                sentiment, score = crew_manager._analyze_sentiment(response_text)
-                
-                # Get persona info from JSON data instead of agents_config
-                if hasattr(crew_manager, '_personas_from_json') and persona_id in crew_manager._personas_from_json:
-                    persona_name = crew_manager._personas_from_json[persona_id]['role']
-                else:
-                    # Fallback to agents_config
-                    persona_config = crew_manager.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                initial_reactions.append({
-                    "id": crew_manager._generate_uuid(),
-                    "persona_id": persona_id,
-                    "persona_name": persona_name.strip(),  # Remove newlines
-                    "avatar": crew_manager._get_avatar_for_persona(persona_id),
-                    "content": response_text.strip(),  # Remove extra whitespace
-                    "sentiment": sentiment,
-                    "sentiment_score": score,
-                    "timestamp": crew_manager._get_timestamp(),
-                    "round": 0  # Initial reactions are round 0
-                })
-                
-            except Exception as e:
-                app.logger.error(f"Error in initial reaction for {persona_id}: {e}")
-                import traceback
-                app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        app.logger.debug("Focus Group Start Data: %s", payload)
+        campaign_description = payload.campaign_description
+        selected_personas, session_goals = payload.personas, payload.goals
+        
+        # Only run Phase 1: Initial Reactions, with all personas answering concurrently
+        # All messages in a phase share one logical timestamp
+        phase_timestamp = crew_manager._get_timestamp()
+        initial_reactions = crew_manager.run_focus_group_start(
+            campaign_description, selected_personas, session_goals, phase_timestamp
+        )
         
         return jsonify({
             "phase": "initial_reactions",
             "messages": initial_reactions,
-            "timestamp": crew_manager._get_timestamp()
+            "timestamp": phase_timestamp
         })
         
     except Exception as e:
@@ -279,81 +396,24 @@ def focus_group_start():
 def focus_group_round():
     """Run a single discussion round"""
     try:
-        data = request.json
-        campaign_description = data.get("campaign_description", "")
-        selected_personas = data.get("personas", [])
-        round_number = data.get("round_number", 1)
-        previous_messages = data.get("previous_messages", [])
-        
-        if not campaign_description or not selected_personas:
+        payload = _validate_body(FocusGroupRoundIn)
+        if payload is None:
             return jsonify({"error": "Campaign description and personas are required"}), 400
-        
-        round_messages = []
-        
-        for persona_id in selected_personas:
-            agent_name = persona_id.replace('-', '_')
-            agent = crew_manager.create_agent(agent_name)
-            
-            if not agent:
-                continue
-            
-            # Create context from previous messages (excluding this persona's own messages)
-            recent_messages = [m for m in previous_messages[-6:] if m.get("persona_id") != persona_id]
-            recent_context = "\n".join([f"{m.get('persona_name', 'Unknown')}: {m.get('content', '')}" for m in recent_messages])
-            
-            task = crew_manager.create_task(
-                'focus_group_discussion_task',
-                agent,
-                campaign_description=campaign_description,
-                recent_context=recent_context or "This is the start of the discussion.",
-                round_number=round_number,
-                agent_name=agent_name
-            )
-            
-            if not task:
-                continue
-            
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
-            
-            try:
-                result = crew.kickoff()
-                response_text = str(result)
-                app.logger.info(f"Round {round_number} Response for {persona_id}: {response_text}")
-                sentiment, score = crew_manager._analyze_sentiment(response_text)
-                
-                # Get persona info from JSON data instead of agents_config
-                if hasattr(crew_manager, '_personas_from_json') and persona_id in crew_manager._personas_from_json:
-                    persona_name = crew_manager._personas_from_json[persona_id]['role']
-                else:
-                    # Fallback to agents_config
-                    persona_config = crew_manager.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                round_messages.append({
-                    "id": crew_manager._generate_uuid(),
-                    "persona_id": persona_id,
-                    "persona_name": persona_name.strip(),  # Remove newlines
-                    "avatar": crew_manager._get_avatar_for_persona(persona_id),
-                    "content": response_text.strip(),  # Remove extra whitespace
-                    "sentiment": sentiment,
-                    "sentiment_score": score,
-                    "timestamp": crew_manager._get_timestamp(),
-                    "round": round_number
-                })
-                
-            except Exception as e:
-                app.logger.error(f"Error in round {round_number} for {persona_id}: {e}")
+        campaign_description = payload.campaign_description
+        selected_personas, round_number = payload.personas, payload.round_number
+        previous_messages = payload.previous_messages
+        
+        # All messages in a round share one logical timestamp
+        round_timestamp = crew_manager._get_timestamp()
+        round_messages = crew_manager.run_focus_group_round(
+            campaign_description, selected_personas, round_number, previous_messages, round_timestamp
+        )
         
         return jsonify({
             "phase": f"round_{round_number}",
             "round_number": round_number,
             "messages": round_messages,
-            "timestamp": crew_manager._get_timestamp()
+            "timestamp": round_timestamp
         })
         
     except Exception as e:
@@ -363,22 +423,24 @@ def focus_group_round():
 def create_custom_persona():
     """Create a custom persona"""
     try:
-        data = request.json
+        payload = _validate_body(CustomPersonaIn)
+        if payload is None:
+            return jsonify({"error": "Invalid persona data"}), 400
         
         # Extract persona details
         persona_data = {
             "id": f"custom-{crew_manager._generate_uuid()}",
-            "name": data.get("name", ""),
-            "role": data.get("role", ""),
-            "industry": data.get("industry", ""),
-            "backstory": data.get("description", ""),
-            "avatar": data.get("avatar", "👤"),
-            "attributes": data.get("customAttributes", {}),
-            "motivations": data.get("motivations", []),
-            "traits": data.get("behavioralTraits", [])
+            "name": payload.name,
+            "role": payload.role,
+            "industry": payload.industry,
+            "backstory": payload.description,
+            "avatar": payload.avatar,
+            "attributes": payload.customAttributes,
+            "motivations": payload.motivations,
+            "traits": payload.behavioralTraits
         }
         
-        app.logger.info(f"Custom Persona Created: {persona_data}")
+        app.logger.debug("Custom Persona Created: %s", persona_data)
         
         return jsonify({
             "success": True,
@@ -389,40 +451,35 @@ def create_custom_persona():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Health fields fixed at startup; the YAML configs are only loaded once
+_HEALTH_STATIC = {
+    "gemini_configured": bool(gemini_api_key),
+    "agents_loaded": len(crew_manager.agents_config or {}),
+    "tasks_loaded": len(crew_manager.tasks_config or {})
+}
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
     return jsonify({
         "status": "healthy",
         "timestamp": crew_manager._get_timestamp(),
-        "gemini_configured": bool(gemini_api_key),
-        "agents_loaded": len(crew_manager.agents_config),
-        "tasks_loaded": len(crew_manager.tasks_config)
+        **_HEALTH_STATIC
     })
 
 @app.route("/api/saved-personas", methods=["GET"])
 def get_saved_personas():
     """Get all saved personas from the personas directory"""
     try:
-        personas_dir = "personas"
-        if not os.path.exists(personas_dir):
-            return jsonify([])
-        
-        personas = []
-        for filename in os.listdir(personas_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(personas_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        persona_data = json.load(f)
-                        # Add filename to the persona data
-                        persona_data['filename'] = filename
-                        personas.append(persona_data)
-                except json.JSONDecodeError:
-                    app.logger.warning(f"Could not parse JSON from {filename}")
-                    continue
-        
-        return jsonify(personas)
+        def build():
+            personas = []
+            for filename, persona_data in _read_persona_files(PERSONAS_DIR):
+                # Add filename to the persona data
+                persona_data['filename'] = filename
+                personas.append(persona_data)
+            return personas
+        
+        return _cached_listing("saved-personas", PERSONAS_DIR, build)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -430,15 +487,15 @@ def get_saved_personas():
 def delete_persona(filename):
     """Delete a specific persona file"""
     try:
-        personas_dir = "personas"
-        filepath = os.path.join(personas_dir, filename)
-        
         # Security check: ensure the file is within the personas directory
-        if not os.path.abspath(filepath).startswith(os.path.abspath(personas_dir)):
+        filepath = os.path.abspath(os.path.join(_PERSONAS_ROOT, filename))
+        if not filepath.startswith(_PERSONAS_ROOT):
             return jsonify({"error": "Invalid file path"}), 400
         
         if os.path.exists(filepath):
             os.remove(filepath)
+            _listing_cache.clear()
+            crew_manager.reload_personas()
             return jsonify({"message": f"Persona {filename} deleted successfully"}), 200
         else:
             return jsonify({"error": "Persona file not found"}), 404
@@ -450,61 +507,32 @@ def delete_persona(filename):
 def save_session():
     """Save session data (interview or focus group) to JSON file"""
     try:
-        data = request.json
+        data = _json_body()
+        if not data:
+            return jsonify({"error": "No session data provided"}), 400
         
         # Create prev_prompts directory if it doesn't exist
         prev_prompts_dir = "prev_prompts"
         if not os.path.exists(prev_prompts_dir):
             os.makedirs(prev_prompts_dir)
         
-        # Generate filename with timestamp
-        import time
-        timestamp = int(time.time())
+        # Generate filename with timestamp; created_at comes from the same clock reading
+        now = datetime.now()
+        timestamp = int(now.timestamp())
         session_type = data.get("session_type", "unknown")
         session_name = data.get("session_name", "session")
         
         # Sanitize session name for filename
-        safe_name = "".join(c for c in session_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
+        safe_name = _safe_filename(session_name)
         
         filename = f"{session_type}_{safe_name}_{timestamp}.json"
         filepath = os.path.join(prev_prompts_dir, filename)
         
         # Enhance persona data with names and avatars
-        enhanced_personas = []
-        if "selected_personas" in data:
-            personas_dir = "personas"
-            if os.path.exists(personas_dir):
-                for persona_id in data["selected_personas"]:
-                    persona_file = f"{persona_id}.json"
-                    persona_path = os.path.join(personas_dir, persona_file)
-                    if os.path.exists(persona_path):
-                        try:
-                            with open(persona_path, 'r') as pf:
-                                persona_data = json.load(pf)
-                                enhanced_personas.append({
-                                    "id": persona_id,
-                                    "name": persona_data.get("name", "Unknown"),
-                                    "role": persona_data.get("role", "Unknown Role"),
-                                    "avatar": persona_data.get("avatar", "👤"),
-                                    "description": persona_data.get("description", "")
-                                })
-                        except:
-                            enhanced_personas.append({
-                                "id": persona_id,
-                                "name": "Unknown",
-                                "role": "Unknown Role",
-                                "avatar": "👤",
-                                "description": ""
-                            })
-                    else:
-                        enhanced_personas.append({
-                            "id": persona_id,
-                            "name": "Unknown",
-                            "role": "Unknown Role",
-                            "avatar": "👤",
-                            "description": ""
-                        })
+        enhanced_personas = [
+            {"id": persona_id, **(crew_manager.get_persona_min(persona_id) or _UNKNOWN_PERSONA)}
+            for persona_id in data.get("selected_personas", ())
+        ]
         
         # Add metadata
         session_data = {
@@ -512,7 +540,7 @@ def save_session():
                 "session_type": session_type,
                 "session_name": session_name,
                 "timestamp": timestamp,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
                 "duration_seconds": data.get("duration", 0)
             },
             "session_data": {
@@ -521,10 +549,10 @@ def save_session():
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(session_data, f, indent=4)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
-        app.logger.info(f"Session saved: {filepath}")
+        app.logger.info("Session saved: %s", filepath)
         
         return jsonify({
             "message": "Session saved successfully",
@@ -545,25 +573,21 @@ def get_sessions():
             return jsonify([])
         
         sessions = []
-        for filename in os.listdir(prev_prompts_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(prev_prompts_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        session_data = json.load(f)
-                        sessions.append({
-                            "filename": filename,
-                            "metadata": session_data.get("metadata", {}),
-                            "session_data": session_data.get("session_data", {})
-                        })
-                except json.JSONDecodeError:
-                    app.logger.warning(f"Could not parse JSON from {filename}")
-                    continue
+        files = _read_session_files(prev_prompts_dir)
+        for filename, session_data in files:
+            timestamp = session_data.get("metadata", {}).get("timestamp", 0)
+            sessions.append((timestamp, _session_entry(filename, session_data)))
+        
+        # Forget encoded entries for files that have since been removed
+        if len(_session_entries) > len(files):
+            current = {filename for filename, _ in files}
+            for filename in [name for name in _session_entries if name not in current]:
+                _session_entries.pop(filename, None)
         
         # Sort by timestamp (newest first)
-        sessions.sort(key=lambda x: x["metadata"].get("timestamp", 0), reverse=True)
+        sessions.sort(key=lambda x: x[0], reverse=True)
         
-        return jsonify(sessions)
+        return _json_array_response(body for _, body in sessions)
         
     except Exception as e:
         app.logger.error(f"Error getting sessions: {e}")
@@ -578,48 +602,30 @@ def get_dashboard_sessions():
             return jsonify([])
         
         sessions = []
-        for filename in os.listdir(prev_prompts_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(prev_prompts_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        session_data = json.load(f)
-                        metadata = session_data.get("metadata", {})
-                        session_info = session_data.get("session_data", {})
-                        
-                        # Extract persona avatars from enhanced_personas if available
-                        persona_avatars = []
-                        if "enhanced_personas" in session_info:
-                            persona_avatars = [p.get("avatar", "👤") for p in session_info["enhanced_personas"]]
-                        elif "selected_personas" in session_info:
-                            # Fallback to loading from personas directory
-                            personas_dir = "personas"
-                            if os.path.exists(personas_dir):
-                                for persona_id in session_info["selected_personas"]:
-                                    persona_file = f"{persona_id}.json"
-                                    persona_path = os.path.join(personas_dir, persona_file)
-                                    if os.path.exists(persona_path):
-                                        try:
-                                            with open(persona_path, 'r') as pf:
-                                                persona_data = json.load(pf)
-                                                persona_avatars.append(persona_data.get("avatar", "👤"))
-                                        except:
-                                            persona_avatars.append("👤")
-                                    else:
-                                        persona_avatars.append("👤")
-                        
-                        sessions.append({
-                            "id": filename.replace('.json', ''),
-                            "name": metadata.get("session_name", "Unknown Session"),
-                            "session_type": metadata.get("session_type", "unknown"),
-                            "persona_avatars": persona_avatars,
-                            "start_date": metadata.get("created_at", ""),
-                            "duration": metadata.get("duration_seconds", 0),
-                            "status": "Completed"  # All saved sessions are completed
-                        })
-                except json.JSONDecodeError:
-                    app.logger.warning(f"Could not parse JSON from {filename}")
-                    continue
+        for filename, session_data in _read_session_files(prev_prompts_dir):
+            metadata = session_data.get("metadata", {})
+            session_info = session_data.get("session_data", {})
+
+            # Extract persona avatars from enhanced_personas if available
+            persona_avatars = []
+            if "enhanced_personas" in session_info:
+                persona_avatars = [p.get("avatar", "👤") for p in session_info["enhanced_personas"]]
+            elif "selected_personas" in session_info:
+                # Fallback to the saved persona index
+                persona_avatars = [
+                    (crew_manager.get_persona_min(persona_id) or _UNKNOWN_PERSONA)["avatar"]
+                    for persona_id in session_info["selected_personas"]
+                ]
+
+            sessions.append({
+                "id": filename.replace('.json', ''),
+                "name": metadata.get("session_name", "Unknown Session"),
+                "session_type": metadata.get("session_type", "unknown"),
+                "persona_avatars": persona_avatars,
+                "start_date": metadata.get("created_at", ""),
+                "duration": metadata.get("duration_seconds", 0),
+                "status": "Completed"  # All saved sessions are completed
+            })
         
         # Sort by timestamp (newest first)
         sessions.sort(key=lambda x: x.get("start_date", ""), reverse=True)
@@ -634,7 +640,7 @@ def get_dashboard_sessions():
 def generate_insights():
     """Generate insights using Gemini AI based on conversation data"""
     try:
-        data = request.json
+        data = _json_body()
         session_data = data.get("session_data", {})
         
         # Extract conversation messages
@@ -646,11 +652,10 @@ def generate_insights():
             return jsonify({"error": "No conversation data provided"}), 400
         
         # Create a prompt for Gemini to analyze the conversation
-        conversation_text = ""
-        for msg in messages:
-            sender = "Interviewer" if msg.get("sender") == "user" else "Persona"
-            content = msg.get("content", "")
-            conversation_text += f"{sender}: {content}\n\n"
+        conversation_text = "".join(
+            f"{'Interviewer' if msg.get('sender') == 'user' else 'Persona'}: {msg.get('content', '')}\n\n"
+            for msg in messages
+        )
         
         prompt = f"""
         Analyze this {session_type} conversation and provide 8 key insights in point form. 
@@ -674,48 +679,42 @@ def generate_insights():
         
         # Use CrewManager to generate insights with Gemini
         try:
-            # Create a simple agent for insight generation
-            agent = crew_manager.create_agent("insight_analyzer")
-            if not agent:
-                # Fallback to direct LLM call
-                from crewai import LLM
-                llm = LLM(
-                    model="gemini/gemini-2.5-flash",
-                    google_api_key=gemini_api_key,
-                    temperature=0.7,
-                    max_tokens=1000
-                )
-                response = llm.complete(prompt)
-                insights_text = str(response)
-            else:
-                # Use CrewAI task
-                task = crew_manager.create_task(
-                    'insight_generation_task',
-                    agent,
-                    prompt=prompt
-                )
-                if task:
-                    crew = Crew(
-                        agents=[agent],
-                        tasks=[task],
-                        process=Process.sequential,
-                        verbose=False
-                    )
-                    result = crew.kickoff()
-                    insights_text = str(result)
+            # Re-analysing an unchanged conversation reuses the earlier generation
+            insights_text = insights_cache.get("insights", prompt)
+            if insights_text is None:
+                # Create a simple agent for insight generation
+                agent = crew_manager.create_agent("insight_analyzer")
+                if not agent:
+                    # Fallback to direct LLM call
+                    llm = get_llm(gemini_api_key, temperature=0.7, max_tokens=1000)
+                    with llm_slot():
+                        response = llm.complete(prompt)
+                    insights_text = str(response)
                 else:
-                    return jsonify({"error": "Failed to create insight generation task"}), 500
+                    # Use CrewAI task
+                    task = crew_manager.create_task(
+                        'insight_generation_task',
+                        agent,
+                        prompt=prompt
+                    )
+                    if task:
+                        # Shares the process-wide cap on in-flight LLM calls
+                        insights_text = crew_manager.kickoff(agent, task)
+                    else:
+                        return jsonify({"error": "Failed to create insight generation task"}), 500
+                insights_cache.set("insights", prompt, insights_text)
             
             # Parse the response into individual insights
             insights = []
-            lines = insights_text.split('\n')
-            for line in lines:
+            for line in insights_text.splitlines():
                 line = line.strip()
-                if line and (line.startswith('•') or line.startswith('-') or line[0].isdigit() or line[0].isupper()):
+                if line and (line.startswith(('•', '-')) or line[0].isdigit() or line[0].isupper()):
                     # Clean up the line
                     clean_line = line.lstrip('•-1234567890. ')
-                    if clean_line and len(clean_line) > 10:  # Ensure it's a substantial insight
+                    if len(clean_line) > 10:  # Ensure it's a substantial insight
                         insights.append(clean_line)
+                        if len(insights) == 8:
+                            break
             
             # If we don't have enough insights, create some fallback ones
             if len(insights) < 4:
@@ -762,4 +761,8 @@ def generate_insights():
         return jsonify({"error": str(e)}), 500
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5000)
+    # Werkzeug's server is for local development only; see README for running under gunicorn
+    app.run(
+        debug=os.getenv("FLASK_DEBUG", "True").lower() in ("1", "true"),
+        port=int(os.getenv("PORT", "5000"))
+    )
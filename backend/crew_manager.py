@@ -1,22 +1,104 @@
 import os
+import re
+import asyncio
 import yaml
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from crewai import Agent, Crew, Task, Process, LLM 
 from datetime import datetime
 import uuid
+import threading
+from prompt_cache import PromptCache
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sentiment keywords, matched against the set of words in a response
+POSITIVE_WORDS = frozenset({'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'brilliant', 'outstanding', 'perfect', 'impressive', 'innovative', 'exciting', 'valuable', 'effective', 'successful'})
+NEGATIVE_WORDS = frozenset({'terrible', 'awful', 'horrible', 'hate', 'disgusting', 'worst', 'disappointing', 'useless', 'failed', 'broken', 'concerning', 'problematic', 'challenging', 'difficult', 'expensive'})
+_WORD_RE = re.compile(r"\w+")
+
+# Sentiment label indexed by the sign of the score
+_SENTIMENT_LABELS = {1: "positive", 0: "neutral", -1: "negative"}
+
+# LLM clients shared by every caller with the same configuration
+_LLM_POOL: Dict[tuple, LLM] = {}
+_LLM_POOL_LOCK = threading.Lock()
+
+def get_llm(api_key: str, model: str = "gemini/gemini-2.5-flash", temperature: float = 0.7, max_tokens: int = 2000) -> LLM:
+    """Return the pooled LLM client for this configuration, creating it on first use"""
+    key = (api_key, model, temperature, max_tokens)
+    with _LLM_POOL_LOCK:
+        llm = _LLM_POOL.get(key)
+        if llm is None:
+            llm = LLM(
+                model=model,
+                google_api_key=api_key,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            _LLM_POOL[key] = llm
+        return llm
+
+# Saved persona JSON files, shared with app.py so both read the same directory
+PERSONAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "personas")
+
+def _personas_dir_mtime() -> Optional[int]:
+    """Modification time of PERSONAS_DIR, which changes whenever a persona file is added or removed"""
+    try:
+        return os.stat(PERSONAS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+# Process-wide cap on in-flight LLM calls, shared by all concurrent requests
+_LLM_SLOTS = threading.BoundedSemaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "16")))
+
+def llm_slot() -> threading.BoundedSemaphore:
+    """Context manager holding one process-wide LLM slot, for calls made outside CrewManager.kickoff"""
+    return _LLM_SLOTS
+
+# Worker threads that run blocking crew kickoffs, kept alive across requests
+_CREW_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CREW_POOL_SIZE", "32")),
+    thread_name_prefix="crew-kickoff"
+)
+
+@dataclass(slots=True)
+class DiscussionMessage:
+    """One persona message in a group discussion or focus-group round"""
+    id: str
+    persona_id: str
+    persona_name: str
+    avatar: str
+    content: str
+    sentiment: str
+    sentiment_score: int
+    timestamp: str
+    round: int
+
+
 class CrewManager:
     """Manages CrewAI agents and tasks for MeshAI backend"""
     
+    _instance: Optional["CrewManager"] = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, gemini_api_key: str) -> "CrewManager":
+        """Return the process-wide manager, creating it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(gemini_api_key)
+            return cls._instance
+    
     def __init__(self, gemini_api_key: str):
-        self.llm = LLM(
-            model="gemini/gemini-2.5-flash",
-            google_api_key=gemini_api_key,
+        self.llm = get_llm(
+            gemini_api_key,
             temperature=0.7,
             max_tokens=2000  # Increased for longer, more complete responses
         )
@@ -24,24 +106,46 @@ class CrewManager:
         # Load configurations
         self.agents_config = self._load_config('config/agents.yaml')
         self.tasks_config = self._load_config('config/tasks.yaml')
+        self._task_templates = {
+            task_type: (
+                self._compile_template(task_config['description']),
+                self._compile_template(task_config['expected_output'])
+            )
+            for task_type, task_config in (self.tasks_config or {}).items()
+        }
+        
+        # Request persona ids resolved to their JSON key
+        self._persona_id_cache = {}
+        # Persona ids mapped to their (display name, avatar)
+        self._profile_cache = {}
+        
+        # Persona role/goal/backstory are built once here rather than per lookup.
+        # The listing resolves ids, so the caches above must exist first.
+        self._personas_mtime = _personas_dir_mtime()
+        self._personas_from_json, self.persona_index = self._load_personas_from_json()
+        self._available_personas = self._build_available_personas()
         
-        # Cache for created agents
-        self._agent_cache = {}
+        # Responses shared across requests for repeated persona prompts
+        self.prompt_cache = PromptCache(int(os.getenv("PROMPT_CACHE_SIZE", "256")))
+        
+        # Upper bound on persona crews running at once within a batch
+        self.persona_concurrency = int(os.getenv("PERSONA_CONCURRENCY", "8"))
 
-    def _load_personas_from_json(self) -> Dict:
-        """Load personas from JSON files in the personas directory"""
+    def _load_personas_from_json(self) -> Tuple[Dict, Dict]:
+        """Load personas from JSON files in the personas directory as (agent configs, display index)"""
         personas = {}
-        personas_dir = os.path.join(os.path.dirname(__file__), "personas")
+        index = {}
+        personas_dir = PERSONAS_DIR
         
         if not os.path.exists(personas_dir):
             print(f"Personas directory not found: {personas_dir}")
-            return personas
+            return personas, index
         
         for filename in os.listdir(personas_dir):
             if filename.endswith('.json'):
                 filepath = os.path.join(personas_dir, filename)
                 try:
-                    with open(filepath, 'r') as f:
+                    with open(filepath, 'rb') as f:
                         persona_data = json.load(f)
                         # Use filename without extension as the key
                         persona_id = filename.replace('.json', '')
@@ -51,11 +155,52 @@ class CrewManager:
                             'backstory': persona_data.get('description', 'A focus group participant'),
                             'avatar': persona_data.get('avatar', '👤')
                         }
+                        index[persona_id] = {
+                            'name': persona_data.get('name', 'Unknown'),
+                            'role': persona_data.get('role', 'Unknown Role'),
+                            'avatar': persona_data.get('avatar', '👤'),
+                            'description': persona_data.get('description', '')
+                        }
                 except Exception as e:
                     print(f"Error loading persona {filename}: {e}")
                     continue
         
-        return personas
+        return personas, index
+    
+    def reload_personas(self) -> None:
+        """Re-read persona JSON files after they change on disk"""
+        # Taken before reading, so files added mid-load trigger another refresh
+        self._personas_mtime = _personas_dir_mtime()
+        self._personas_from_json, self.persona_index = self._load_personas_from_json()
+        # Drop mappings to personas that may no longer exist before the listing resolves ids again
+        self._persona_id_cache.clear()
+        self._profile_cache.clear()
+        # Responses were generated by the old persona definitions
+        self.prompt_cache.clear()
+        self._available_personas = self._build_available_personas()
+    
+    def refresh_personas(self) -> None:
+        """Reload personas if files were added or removed since the last load, e.g. by another worker process"""
+        if _personas_dir_mtime() != self._personas_mtime:
+            self.reload_personas()
+    
+    def get_persona_min(self, persona_id: str) -> Optional[Dict]:
+        """Name, role, avatar and description of a saved persona, or None if there is no such file"""
+        self.refresh_personas()
+        return self.persona_index.get(persona_id)
+    
+    def _resolve_persona_id(self, persona_id: str) -> Optional[str]:
+        """Map a persona id in either hyphen or underscore form to its JSON key"""
+        lookup_id = self._persona_id_cache.get(persona_id)
+        if lookup_id is not None:
+            return lookup_id
+        
+        for candidate in (persona_id, persona_id.replace('_', '-'), persona_id.replace('-', '_')):
+            if candidate in self._personas_from_json:
+                # Unknown ids are not cached so arbitrary input can't grow the map
+                self._persona_id_cache[persona_id] = candidate
+                return candidate
+        return None
     
     def _load_config(self, filepath: str) -> Dict:
         """Load YAML configuration file"""
@@ -71,35 +216,20 @@ class CrewManager:
             return {}
     
     def create_agent(self, persona_id: str) -> Optional[Agent]:
-        """Create or retrieve cached agent from persona JSON files"""
-        if persona_id in self._agent_cache:
-            return self._agent_cache[persona_id]
-        
-        # Load personas from JSON if not already loaded
-        if not hasattr(self, '_personas_from_json'):
-            self._personas_from_json = self._load_personas_from_json()
-        
-        # Try both the original persona_id and the converted version
-        lookup_id = persona_id
-        if persona_id not in self._personas_from_json:
-            # Try converting from underscore to hyphen format
-            alt_id = persona_id.replace('_', '-')
-            if alt_id in self._personas_from_json:
-                lookup_id = alt_id
-            else:
-                # Try converting from hyphen to underscore format
-                alt_id = persona_id.replace('-', '_')
-                if alt_id in self._personas_from_json:
-                    lookup_id = alt_id
-                else:
-                    print(f"Persona configuration for '{persona_id}' not found in JSON files")
-                    print(f"Available personas: {list(self._personas_from_json.keys())}")
-                    return None
+        """Create an agent from persona JSON files.
         
-        config = self._personas_from_json[lookup_id]
+        Every call builds a new Agent, since one crewai Agent must not run two
+        tasks at once; the LLM client behind it is pooled, so this is cheap.
+        """
+        lookup_id = self._resolve_persona_id(persona_id)
+        config = self._personas_from_json.get(lookup_id) if lookup_id is not None else None
+        if config is None:
+            print(f"Persona configuration for '{persona_id}' not found in JSON files")
+            print(f"Available personas: {list(self._personas_from_json.keys())}")
+            return None
         
         # Create agent from persona data
-        agent = Agent(
+        return Agent(
             role=config['role'],
             goal=config['goal'],
             backstory=config['backstory'],
@@ -108,21 +238,40 @@ class CrewManager:
             allow_delegation=False,
             memory=True
         )
+    
+    def create_agents(self, selected_personas: List[str]) -> List[Tuple[str, str, Agent]]:
+        """Build (persona_id, agent_name, agent) for each persona that has a configuration"""
+        agents = []
+        
+        for persona_id in selected_personas:
+            # Convert persona_id format (e.g., "tech-enthusiast" -> "tech_enthusiast")
+            agent_name = persona_id.replace('-', '_')
+            
+            agent = self.create_agent(agent_name)
+            if agent:
+                agents.append((persona_id, agent_name, agent))
         
-        self._agent_cache[persona_id] = agent
-        return agent
+        return agents
+    
+    @staticmethod
+    def _compile_template(template: str) -> Callable[..., str]:
+        """Return a formatter for a task template, resolving field-free templates once"""
+        if any(field is not None for _, field, _, _ in Formatter().parse(template)):
+            return template.format
+        static_text = template.format()
+        return lambda **kwargs: static_text
     
     def create_task(self, task_type: str, agent: Agent, **kwargs) -> Optional[Task]:
         """Create a task with dynamic parameters"""
-        if task_type not in self.tasks_config:
+        if task_type not in self._task_templates:
             print(f"Task configuration for '{task_type}' not found")
             return None
         
-        task_config = self.tasks_config[task_type]
+        format_description, format_expected_output = self._task_templates[task_type]
         
         # Format description and expected_output with provided kwargs
-        description = task_config['description'].format(**kwargs)
-        expected_output = task_config['expected_output'].format(**kwargs)
+        description = format_description(**kwargs)
+        expected_output = format_expected_output(**kwargs)
         
         return Task(
             description=description,
@@ -130,90 +279,172 @@ class CrewManager:
             agent=agent
         )
     
-    def run_simple_interaction(self, question: str, selected_personas: List[str]) -> List[Dict]:
-        """Handle simple Q&A interaction with selected personas"""
-        reactions = []
+    def _cache_prompt(self, agent: Agent, task: Task) -> str:
+        """Text that fully determines a persona's response to a task"""
+        return f"{agent.goal}\n{agent.backstory}\n{task.description}\n{task.expected_output}"
+    
+    def _build_crew(self, agent: Agent, task: Task) -> Crew:
+        """Wrap a single agent and task in a sequential crew"""
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False
+        )
+    
+    def kickoff(self, agent: Agent, task: Task) -> str:
+        """Run a single-agent crew, serving repeated prompts from the cache"""
+        prompt = self._cache_prompt(agent, task)
+        cached = self.prompt_cache.get(agent.role, prompt)
+        if cached is not None:
+            return cached
         
-        for persona_id in selected_personas:
-            # Convert persona_id format (e.g., "tech-enthusiast" -> "tech_enthusiast")
-            agent_name = persona_id.replace('-', '_')
-            
-            agent = self.create_agent(agent_name)
-            if not agent:
-                continue
-            
+        crew = self._build_crew(agent, task)
+        with _LLM_SLOTS:
+            response_text = str(crew.kickoff())
+        self.prompt_cache.set(agent.role, prompt, response_text)
+        return response_text
+    
+    async def akickoff(self, agent: Agent, task: Task) -> str:
+        """Run a single-agent crew on the shared kickoff pool without blocking the event loop"""
+        # An explicit executor outlives the per-batch loop that asyncio.run tears down
+        return await asyncio.get_running_loop().run_in_executor(_CREW_POOL, self.kickoff, agent, task)
+    
+    async def abatch(self, jobs: List[Tuple[Agent, Task]]) -> List[Any]:
+        """Run (agent, task) pairs concurrently, bounded by PERSONA_CONCURRENCY.
+        
+        Results are returned in input order; a failed job yields its exception.
+        """
+        # Created per batch since asyncio primitives bind to the running loop
+        semaphore = asyncio.Semaphore(self.persona_concurrency)
+        
+        async def run(agent: Agent, task: Task) -> str:
+            async with semaphore:
+                return await self.akickoff(agent, task)
+        
+        return await asyncio.gather(
+            *(run(agent, task) for agent, task in jobs),
+            return_exceptions=True
+        )
+    
+    def kickoff_batch(self, jobs: List[Tuple[Agent, Task]]) -> List[Any]:
+        """Synchronous entry point to abatch for non-async callers"""
+        if not jobs:
+            return []
+        return asyncio.run(self.abatch(jobs))
+    
+    def _simple_interaction_jobs(self, question: str, selected_personas: List[str], context: str = "Simple Q&A interaction") -> List[Tuple[str, str, Agent, Task]]:
+        """Build (persona_id, agent_name, agent, task) for each usable persona"""
+        jobs = []
+        
+        for persona_id, agent_name, agent in self.create_agents(selected_personas):
             task = self.create_task(
                 'initial_reaction_task',
                 agent,
                 topic=question,
-                context="Simple Q&A interaction",
+                context=context,
                 agent_name=agent_name
             )
             
             if not task:
                 continue
             
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
-            
-            try:
-                result = crew.kickoff()
-                response_text = str(result)
-                logger.info(f"CrewAI Response for {persona_id}: {response_text}")
-                sentiment, score = self._analyze_sentiment(response_text)
-                
-                # Get persona info from JSON data instead of agents_config
-                if hasattr(self, '_personas_from_json') and persona_id in self._personas_from_json:
-                    persona_name = self._personas_from_json[persona_id]['role']
-                else:
-                    # Fallback to agents_config
-                    persona_config = self.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                reactions.append({
-                    "persona_id": persona_id,
-                    "name": persona_name,
-                    "avatar": self._get_avatar_for_persona(persona_id),
-                    "reaction": response_text,
-                    "sentiment": sentiment,
-                    "sentiment_score": score
-                })
-                
-            except Exception as e:
-                print(f"Error with persona {persona_id}: {e}")
-                # Fallback response
-                if hasattr(self, '_personas_from_json') and persona_id in self._personas_from_json:
-                    persona_name = self._personas_from_json[persona_id]['role']
-                else:
-                    persona_config = self.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                reactions.append({
-                    "persona_id": persona_id,
-                    "name": persona_name,
-                    "avatar": self._get_avatar_for_persona(persona_id),
-                    "reaction": f"{e}",
-                    "sentiment": "neutral",
-                    "sentiment_score": 0
-                })
-        
-        return reactions
-    
-    def run_group_discussion(self, question: str, selected_personas: List[str], initial_reactions: List[Dict]) -> List[Dict]:
+            jobs.append((persona_id, agent_name, agent, task))
+        
+        return jobs
+    
+    def _build_reaction(self, persona_id: str, agent_name: str, result: Any) -> Dict:
+        """Turn a kickoff result, or the exception it raised, into a reaction"""
+        if isinstance(result, Exception):
+            print(f"Error with persona {persona_id}: {result}")
+            # Fallback response
+            response_text, sentiment, score = f"{result}", "neutral", 0
+        else:
+            logger.debug("CrewAI Response for %s: %s", persona_id, result)
+            response_text, sentiment, score = self._process_response(result)
+        
+        name, avatar = self._persona_profile(persona_id, agent_name)
+        return {
+            "persona_id": persona_id,
+            "name": name,
+            "avatar": avatar,
+            "reaction": response_text,
+            "sentiment": sentiment,
+            "sentiment_score": score
+        }
+    
+    def run_simple_interaction(self, question: str, selected_personas: List[str]) -> List[Dict]:
+        """Handle simple Q&A interaction with selected personas"""
+        jobs = self._simple_interaction_jobs(question, selected_personas)
+        
+        # All personas answer concurrently; results come back in persona order
+        results = self.kickoff_batch([(agent, task) for _, _, agent, task in jobs])
+        
+        return [
+            self._build_reaction(persona_id, agent_name, result)
+            for (persona_id, agent_name, _, _), result in zip(jobs, results)
+        ]
+    
+    def iter_simple_interaction(self, question: str, selected_personas: List[str]) -> Iterator[Dict]:
+        """Yield each persona's reaction as soon as it is ready, in completion order"""
+        jobs = iter(self._simple_interaction_jobs(question, selected_personas))
+        futures = {}
+        
+        def submit_next() -> None:
+            job = next(jobs, None)
+            if job is not None:
+                persona_id, agent_name, agent, task = job
+                futures[_CREW_POOL.submit(self.kickoff, agent, task)] = (persona_id, agent_name)
+        
+        # Same per-request bound as abatch: only persona_concurrency jobs are ever
+        # submitted, and the next one goes in as each finishes
+        for _ in range(self.persona_concurrency):
+            submit_next()
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    persona_id, agent_name = futures.pop(future)
+                    submit_next()
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    yield self._build_reaction(persona_id, agent_name, result)
+        finally:
+            # A client that disconnects early leaves the rest of the jobs unsubmitted;
+            # anything still waiting for a pool thread is dropped too
+            for future in futures:
+                future.cancel()
+    
+    def run_batch_interaction(self, questions: List[str], selected_personas: List[str]) -> List[Dict]:
+        """Ask every persona every question, each question as one concurrent batch"""
+        # Every job has its own agent, so all questions fan out as one batch
+        jobs_per_question = [
+            self._simple_interaction_jobs(question, selected_personas, context="Batch Q&A interaction")
+            for question in questions
+        ]
+        outputs = iter(self.kickoff_batch([
+            (agent, task) for jobs in jobs_per_question for _, _, agent, task in jobs
+        ]))
+        
+        return [
+            {
+                "question": question,
+                "reactions": [
+                    self._build_reaction(persona_id, agent_name, next(outputs))
+                    for persona_id, agent_name, _, _ in jobs
+                ]
+            }
+            for question, jobs in zip(questions, jobs_per_question)
+        ]
+    
+    def run_group_discussion(self, question: str, selected_personas: List[str], initial_reactions: List[Dict]) -> List[DiscussionMessage]:
         """Handle group discussion between personas"""
         discussion_messages = []
+        jobs = []
         
-        for persona_id in selected_personas:
-            agent_name = persona_id.replace('-', '_')
-            agent = self.create_agent(agent_name)
-            
-            if not agent:
-                continue
-            
+        for persona_id, agent_name, agent in self.create_agents(selected_personas):
             # Create context from other reactions
             other_reactions = [r for r in initial_reactions if r["persona_id"] != persona_id]
             other_reactions_text = "\n".join([f"{r['name']}: {r['reaction']}" for r in other_reactions])
@@ -230,118 +461,138 @@ class CrewManager:
             if not task:
                 continue
             
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
+            jobs.append((persona_id, agent_name, agent, task))
+        
+        # Every persona reacts to the same initial reactions, so they run concurrently
+        results = self.kickoff_batch([(agent, task) for _, _, agent, task in jobs])
+        discussion_timestamp = self._get_timestamp()
+        
+        for (persona_id, agent_name, _, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                print(f"Error in discussion with persona {persona_id}: {result}")
+                continue
             
-            try:
-                result = crew.kickoff()
-                response_text = str(result)
-                logger.info(f"CrewAI Group Discussion Response for {persona_id}: {response_text}")
-                sentiment, score = self._analyze_sentiment(response_text)
-                
-                # Get persona info from JSON data instead of agents_config
-                if hasattr(self, '_personas_from_json') and persona_id in self._personas_from_json:
-                    persona_name = self._personas_from_json[persona_id]['role']
-                else:
-                    # Fallback to agents_config
-                    persona_config = self.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                discussion_messages.append({
-                    "id": str(uuid.uuid4()),
-                    "persona_id": persona_id,
-                    "persona_name": persona_name,
-                    "avatar": self._get_avatar_for_persona(persona_id),
-                    "content": response_text,
-                    "sentiment": sentiment,
-                    "sentiment_score": score,
-                    "timestamp": datetime.now().isoformat(),
-                    "round": 1
-                })
-                
-            except Exception as e:
-                print(f"Error in discussion with persona {persona_id}: {e}")
+            logger.debug("CrewAI Group Discussion Response for %s: %s", persona_id, result)
+            response_text, sentiment, score = self._process_response(result)
+            persona_name, avatar = self._persona_profile(persona_id, agent_name)
+            
+            discussion_messages.append(DiscussionMessage(
+                id=self._generate_uuid(),
+                persona_id=persona_id,
+                persona_name=persona_name,
+                avatar=avatar,
+                content=response_text,
+                sentiment=sentiment,
+                sentiment_score=score,
+                timestamp=discussion_timestamp,
+                round=1
+            ))
         
         return discussion_messages
     
     def run_focus_group_simulation(self, campaign_description: str, selected_personas: List[str], session_goals: List[str]) -> Dict:
         """Handle comprehensive focus group simulation"""
+        result = {
+            "campaign_description": campaign_description,
+            "session_goals": session_goals,
+            "initial_reactions": [],
+            "discussion_messages": [],
+            "sentiment_intervals": []
+        }
+        collected = {
+            "initial": result["initial_reactions"],
+            "message": result["discussion_messages"],
+            "interval": result["sentiment_intervals"]
+        }
+        
+        for event in self.iter_focus_group_simulation(campaign_description, selected_personas, session_goals):
+            if event["phase"] == "summary":
+                result.update(event["data"])
+            else:
+                collected[event["phase"]].append(event["data"])
+        
+        return result
+    
+    def iter_focus_group_simulation(self, campaign_description: str, selected_personas: List[str], session_goals: List[str]) -> Iterator[Dict]:
+        """Yield focus group events (initial, message, interval, summary) as each phase completes"""
         
         # Phase 1: Initial Reactions
         initial_reactions = []
+        # Running totals for the overall metrics, updated as reactions arrive
+        total_sentiment = total_nps = total_csat = 0
         agents_data = []
+        jobs = []
+        goals_text = ", ".join(session_goals)
         
-        for persona_id in selected_personas:
-            agent = self.create_agent(persona_id)
-            
-            if not agent:
-                continue
-            
-            # Convert persona_id to agent_name format for config lookup
-            agent_name = persona_id.replace('-', '_')
+        agents = self.create_agents(selected_personas)
+        # Names and avatars are fixed for the session, so every phase shares one lookup
+        profiles = self._persona_profiles(agents)
+        
+        for persona_id, agent_name, agent in agents:
             agents_data.append((persona_id, agent, agent_name))
             
             task = self.create_task(
                 'focus_group_initial_task',
                 agent,
                 campaign_description=campaign_description,
-                session_goals=", ".join(session_goals),
+                session_goals=goals_text,
                 agent_name=agent_name
             )
             
             if not task:
                 continue
             
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
+            jobs.append((persona_id, agent_name, agent, task))
+        
+        results = self.kickoff_batch([(agent, task) for _, _, agent, task in jobs])
+        
+        for (persona_id, agent_name, _, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                print(f"Error in initial reaction for {persona_id}: {result}")
+                continue
             
-            try:
-                result = crew.kickoff()
-                response_text = str(result)
-                logger.info(f"CrewAI Focus Group Initial Reaction for {persona_id}: {response_text}")
-                sentiment, score = self._analyze_sentiment(response_text)
-                
-                # Get persona info from JSON data instead of agents_config
-                if hasattr(self, '_personas_from_json') and persona_id in self._personas_from_json:
-                    persona_name = self._personas_from_json[persona_id]['role']
-                else:
-                    # Fallback to agents_config
-                    persona_config = self.agents_config.get(agent_name, {})
-                    persona_name = persona_config.get('role', 'Unknown Role')
-                
-                initial_reactions.append({
-                    "persona_id": persona_id,
-                    "persona_name": persona_name,
-                    "avatar": self._get_avatar_for_persona(persona_id),
-                    "reaction": response_text,
-                    "sentiment": sentiment,
-                    "sentiment_score": score,
-                    "nps_score": max(0, min(10, 5 + score)),
-                    "csat_score": max(1, min(5, 3 + score/2))
-                })
-                
-            except Exception as e:
-                print(f"Error in initial reaction for {persona_id}: {e}")
+            logger.debug("CrewAI Focus Group Initial Reaction for %s: %s", persona_id, result)
+            response_text, sentiment, score = self._process_response(result)
+            persona_name, avatar = profiles[persona_id]
+            
+            reaction = {
+                "persona_id": persona_id,
+                "persona_name": persona_name,
+                "avatar": avatar,
+                "reaction": response_text,
+                "sentiment": sentiment,
+                "sentiment_score": score,
+                "nps_score": max(0, min(10, 5 + score)),
+                "csat_score": max(1, min(5, 3 + score/2))
+            }
+            initial_reactions.append(reaction)
+            total_sentiment += score
+            total_nps += reaction["nps_score"]
+            total_csat += reaction["csat_score"]
+            yield {"phase": "initial", "data": reaction}
         
         # Phase 2: Group Discussion (3 rounds)
         discussion_messages = []
-        sentiment_intervals = []
+        # Last 6 messages as (persona_id, "name: content") lines, formatted once
+        recent_window = deque(maxlen=6)
         
         for round_num in range(1, 4):
-            round_messages = []
+            round_score_sum = round_count = 0
+            jobs = []
+            
+            # Context is the window as of the start of the round, so every
+            # persona in the round can answer concurrently
+            window = tuple(recent_window)
+            speakers = {speaker for speaker, _ in window}
+            shared_context = "\n".join(line for _, line in window)
             
             for persona_id, agent, agent_name in agents_data:
-                # Create context from previous discussion
-                recent_messages = [m for m in discussion_messages[-6:] if m["persona_id"] != persona_id]
-                recent_context = "\n".join([f"{m['persona_name']}: {m['content']}" for m in recent_messages])
+                # Create context from previous discussion; personas who didn't
+                # speak in the window all see the same text
+                if persona_id in speakers:
+                    recent_context = "\n".join(line for speaker, line in window if speaker != persona_id)
+                else:
+                    recent_context = shared_context
                 
                 task = self.create_task(
                     'focus_group_discussion_task',
@@ -355,53 +606,27 @@ class CrewManager:
                 if not task:
                     continue
                 
-                crew = Crew(
-                    agents=[agent],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=False
-                )
-                
-                try:
-                    result = crew.kickoff()
-                    response_text = str(result)
-                    logger.info(f"CrewAI Focus Group Round {round_num} Response for {persona_id}: {response_text}")
-                    sentiment, score = self._analyze_sentiment(response_text)
-                    
-                    # Get persona info from JSON data instead of agents_config
-                    if hasattr(self, '_personas_from_json') and persona_id in self._personas_from_json:
-                        persona_name = self._personas_from_json[persona_id]['role']
-                    else:
-                        # Fallback to agents_config
-                        persona_config = self.agents_config.get(agent_name, {})
-                        persona_name = persona_config.get('role', 'Unknown Role')
-                    
-                    message = {
-                        "id": str(uuid.uuid4()),
-                        "persona_id": persona_id,
-                        "persona_name": persona_name,
-                        "avatar": self._get_avatar_for_persona(persona_id),
-                        "content": response_text,
-                        "sentiment": sentiment,
-                        "sentiment_score": score,
-                        "timestamp": datetime.now().isoformat(),
-                        "round": round_num
-                    }
-                    
-                    round_messages.append(message)
-                    discussion_messages.append(message)
-                    
-                except Exception as e:
-                    print(f"Error in round {round_num} for {persona_id}: {e}")
+                jobs.append((persona_id, agent_name, agent, task))
+            
+            # Messages in a round share one logical timestamp
+            round_timestamp = self._get_timestamp()
+            
+            for message in self._collect_messages(jobs, round_num, round_timestamp, f"round {round_num}", profiles):
+                round_score_sum += message.sentiment_score
+                round_count += 1
+                discussion_messages.append(message)
+                recent_window.append((message.persona_id, f"{message.persona_name}: {message.content}"))
+                yield {"phase": "message", "data": message}
             
             # Track sentiment at intervals
             if round_num in [2, 3]:
-                round_sentiment = sum([m["sentiment_score"] for m in round_messages]) / len(round_messages) if round_messages else 0
-                sentiment_intervals.append({
+                round_sentiment = round_score_sum / round_count if round_count else 0
+                interval = {
                     "round": round_num,
                     "average_sentiment": round_sentiment,
-                    "timestamp": datetime.now().isoformat()
-                })
+                    "timestamp": round_timestamp
+                }
+                yield {"phase": "interval", "data": interval}
         
         # Phase 3: Final Summary
         if agents_data:
@@ -409,13 +634,11 @@ class CrewManager:
             summary_agent_name = agents_data[0][2]  # Get the agent_name for the summary task
             
             # Create full context
-            full_context = f"Initial Reactions:\n"
-            for reaction in initial_reactions:
-                full_context += f"{reaction['persona_name']}: {reaction['reaction']}\n"
-            
-            full_context += f"\nDiscussion Messages:\n"
-            for msg in discussion_messages:
-                full_context += f"Round {msg['round']} - {msg['persona_name']}: {msg['content']}\n"
+            parts = ["Initial Reactions:\n"]
+            parts.extend(f"{reaction['persona_name']}: {reaction['reaction']}\n" for reaction in initial_reactions)
+            parts.append("\nDiscussion Messages:\n")
+            parts.extend(f"Round {msg.round} - {msg.persona_name}: {msg.content}\n" for msg in discussion_messages)
+            full_context = "".join(parts)
             
             summary_task = self.create_task(
                 'summary_synthesis_task',
@@ -426,17 +649,10 @@ class CrewManager:
             )
             
             if summary_task:
-                summary_crew = Crew(
-                    agents=[summary_agent],
-                    tasks=[summary_task],
-                    process=Process.sequential,
-                    verbose=False
-                )
-                
                 try:
-                    summary_result = summary_crew.kickoff()
-                    final_summary = str(summary_result)
-                    logger.info(f"CrewAI Focus Group Summary: {final_summary}")
+                    # Goes through kickoff so the summary also takes an LLM slot
+                    final_summary = self.kickoff(summary_agent, summary_task)
+                    logger.debug("CrewAI Focus Group Summary: %s", final_summary)
                 except Exception as e:
                     print(f"Error creating summary: {e}")
                     final_summary = "Summary generation encountered an error."
@@ -446,73 +662,163 @@ class CrewManager:
             final_summary = "No agents available for summary generation."
         
         # Calculate overall metrics
-        overall_sentiment = sum([r["sentiment_score"] for r in initial_reactions]) / len(initial_reactions) if initial_reactions else 0
-        overall_nps = sum([r["nps_score"] for r in initial_reactions]) / len(initial_reactions) if initial_reactions else 5
-        overall_csat = sum([r["csat_score"] for r in initial_reactions]) / len(initial_reactions) if initial_reactions else 3
+        overall_sentiment, overall_nps, overall_csat = 0, 5, 3
+        if initial_reactions:
+            count = len(initial_reactions)
+            overall_sentiment = total_sentiment / count
+            overall_nps = total_nps / count
+            overall_csat = total_csat / count
         
-        return {
-            "campaign_description": campaign_description,
-            "session_goals": session_goals,
-            "initial_reactions": initial_reactions,
-            "discussion_messages": discussion_messages,
-            "sentiment_intervals": sentiment_intervals,
-            "final_summary": final_summary,
-            "overall_metrics": {
-                "nps": round(overall_nps, 1),
-                "csat": round(overall_csat, 1),
-                "avg_sentiment": round(overall_sentiment, 1)
-            },
-            "timestamp": datetime.now().isoformat()
+        yield {
+            "phase": "summary",
+            "data": {
+                "final_summary": final_summary,
+                "overall_metrics": {
+                    "nps": round(overall_nps, 1),
+                    "csat": round(overall_csat, 1),
+                    "avg_sentiment": round(overall_sentiment, 1)
+                },
+                "timestamp": datetime.now().isoformat()
+            }
         }
     
+    def _persona_profiles(self, agents: List[Tuple[str, str, Agent]]) -> Dict[str, Tuple[str, str]]:
+        """Look up each persona's display name and avatar once for a whole session"""
+        profiles = {}
+        for persona_id, agent_name, _ in agents:
+            name, avatar = self._persona_profile(persona_id, agent_name)
+            profiles[persona_id] = (name.strip(), avatar)
+        return profiles
+    
+    def _collect_messages(self, jobs: List[Tuple[str, str, Agent, Task]], round_number: int, timestamp: str, label: str, profiles: Optional[Dict[str, Tuple[str, str]]] = None) -> List[DiscussionMessage]:
+        """Run persona jobs concurrently and wrap each successful response as a message, in persona order"""
+        if profiles is None:
+            profiles = self._persona_profiles([(persona_id, agent_name, agent) for persona_id, agent_name, agent, _ in jobs])
+        messages = []
+        results = self.kickoff_batch([(agent, task) for _, _, agent, task in jobs])
+        
+        for (persona_id, agent_name, _, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.error("Error in %s for %s", label, persona_id, exc_info=result)
+                continue
+            
+            logger.debug("CrewAI Focus Group %s response for %s: %s", label, persona_id, result)
+            response_text, sentiment, score = self._process_response(result)
+            persona_name, avatar = profiles[persona_id]
+            
+            messages.append(DiscussionMessage(
+                id=self._generate_uuid(),
+                persona_id=persona_id,
+                persona_name=persona_name,
+                avatar=avatar,
+                content=response_text,
+                sentiment=sentiment,
+                sentiment_score=score,
+                timestamp=timestamp,
+                round=round_number
+            ))
+        
+        return messages
+    
+    def run_focus_group_start(self, campaign_description: str, selected_personas: List[str], session_goals: List[str], timestamp: str) -> List[DiscussionMessage]:
+        """Run the initial-reaction phase of a step-by-step focus group (round 0)"""
+        goals_text = ", ".join(session_goals)
+        jobs = []
+        
+        for persona_id, agent_name, agent in self.create_agents(selected_personas):
+            task = self.create_task(
+                'focus_group_initial_task',
+                agent,
+                campaign_description=campaign_description,
+                session_goals=goals_text,
+                agent_name=agent_name
+            )
+            
+            if not task:
+                continue
+            
+            jobs.append((persona_id, agent_name, agent, task))
+        
+        return self._collect_messages(jobs, 0, timestamp, "initial reaction")
+    
+    def run_focus_group_round(self, campaign_description: str, selected_personas: List[str], round_number: int, previous_messages: List[Dict], timestamp: str) -> List[DiscussionMessage]:
+        """Run one discussion round of a step-by-step focus group"""
+        # The context window is the same for every persona in the round, so its
+        # lines are formatted once as (persona_id, "name: content")
+        recent_window = [
+            (m.get("persona_id"), f"{m.get('persona_name', 'Unknown')}: {m.get('content', '')}")
+            for m in previous_messages[-6:]
+        ]
+        jobs = []
+        
+        for persona_id, agent_name, agent in self.create_agents(selected_personas):
+            # Create context from previous messages (excluding this persona's own messages)
+            recent_context = "\n".join(line for speaker, line in recent_window if speaker != persona_id)
+            
+            task = self.create_task(
+                'focus_group_discussion_task',
+                agent,
+                campaign_description=campaign_description,
+                recent_context=recent_context or "This is the start of the discussion.",
+                round_number=round_number,
+                agent_name=agent_name
+            )
+            
+            if not task:
+                continue
+            
+            jobs.append((persona_id, agent_name, agent, task))
+        
+        return self._collect_messages(jobs, round_number, timestamp, f"round {round_number}")
+    
+    def _process_response(self, response_text: str) -> Tuple[str, str, int]:
+        """Normalize a persona response and score it in one place"""
+        content = response_text.strip()
+        sentiment, score = self._analyze_sentiment(content)
+        return content, sentiment, score
+    
     def _analyze_sentiment(self, text: str) -> tuple[str, int]:
         """Analyze sentiment of text and return sentiment label and score"""
-        positive_words = ['great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'brilliant', 'outstanding', 'perfect', 'impressive', 'innovative', 'exciting', 'valuable', 'effective', 'successful']
-        negative_words = ['terrible', 'awful', 'horrible', 'hate', 'disgusting', 'worst', 'disappointing', 'useless', 'failed', 'broken', 'concerning', 'problematic', 'challenging', 'difficult', 'expensive']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_count > negative_count:
-            sentiment = "positive"
-            score = min(5, positive_count - negative_count)
-        elif negative_count > positive_count:
-            sentiment = "negative" 
-            score = max(-5, -(negative_count - positive_count))
-        else:
-            sentiment = "neutral"
-            score = 0
-            
-        return sentiment, score
+        # One tokenizing pass; each keyword counts once, however often it appears
+        words = set(_WORD_RE.findall(text.lower()))
+        positive_count = len(words & POSITIVE_WORDS)
+        negative_count = len(words & NEGATIVE_WORDS)
+        
+        score = max(-5, min(5, positive_count - negative_count))
+        return _SENTIMENT_LABELS[(score > 0) - (score < 0)], score
+    
+    def _persona_profile(self, persona_id: str, agent_name: str) -> Tuple[str, str]:
+        """Display name and avatar for a persona, memoized until personas are reloaded"""
+        profile = self._profile_cache.get(persona_id)
+        if profile is None:
+            profile = (self._get_persona_name(persona_id, agent_name), self._get_avatar_for_persona(persona_id))
+            self._profile_cache[persona_id] = profile
+        return profile
+    
+    def _get_persona_name(self, persona_id: str, agent_name: str) -> str:
+        """Get display name from persona JSON, falling back to agents_config"""
+        if persona_id in self._personas_from_json:
+            return self._personas_from_json[persona_id]['role']
+        persona_config = self.agents_config.get(agent_name, {})
+        return persona_config.get('role', 'Unknown Role')
     
     def _get_avatar_for_persona(self, persona_id: str) -> str:
         """Get avatar emoji for persona from JSON data"""
-        if not hasattr(self, '_personas_from_json'):
-            self._personas_from_json = self._load_personas_from_json()
-        
-        # Try both the original persona_id and the converted version
-        lookup_id = persona_id
-        if persona_id not in self._personas_from_json:
-            # Try converting from underscore to hyphen format
-            alt_id = persona_id.replace('_', '-')
-            if alt_id in self._personas_from_json:
-                lookup_id = alt_id
-            else:
-                # Try converting from hyphen to underscore format
-                alt_id = persona_id.replace('-', '_')
-                if alt_id in self._personas_from_json:
-                    lookup_id = alt_id
-                else:
-                    # Fallback to default avatar
-                    return "👤"
+        lookup_id = self._resolve_persona_id(persona_id)
+        if lookup_id is None:
+            # Fallback to default avatar
+            return "👤"
         
         return self._personas_from_json[lookup_id]['avatar']
     
     def get_available_personas(self) -> List[Dict]:
         """Get list of available personas"""
+        return self._available_personas
+    
+    def _build_available_personas(self) -> List[Dict]:
+        """Build the persona listing served by get_available_personas"""
         personas = []
-        for agent_name, config in self.agents_config.items():
+        for agent_name, config in (self.agents_config or {}).items():
             persona_id = agent_name.replace('_', '-')
             personas.append({
                 "id": persona_id,
@@ -527,5 +833,6 @@ class CrewManager:
         return datetime.now().isoformat()
     
     def _generate_uuid(self) -> str:
-        """Generate a UUID string"""
-        return str(uuid.uuid4()) 
\ No newline at end of file
+        """Generate a UUID4 as a 32-character hex string"""
+        # .hex skips the dashed formatting done by str(UUID)
+        return uuid.uuid4().hex 
\ No newline at end of file
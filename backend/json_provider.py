@@ -0,0 +1,32 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+
+    def _dumpb(self, obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+        # Non-string keys are coerced like the stdlib encoder does
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dumpb(
+            obj,
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+            indent=bool(kwargs.get("indent"))
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build the response body from orjson's bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        body = self._dumpb(obj, sort_keys=self.sort_keys, indent=pretty)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
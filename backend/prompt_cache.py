@@ -0,0 +1,46 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class PromptCache:
+    """Process-wide LRU cache of LLM responses keyed by persona and prompt"""
+
+    __slots__ = ('maxsize', '_entries', '_lock')
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(persona_id: str, prompt: str) -> tuple:
+        # Namespaced by persona so identical questions don't cross personas
+        return persona_id, hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+    def get(self, persona_id: str, prompt: str) -> Optional[str]:
+        """Return the cached response for this persona/prompt, if any"""
+        if self.maxsize <= 0:
+            return None
+        key = self._key(persona_id, prompt)
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, persona_id: str, prompt: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        key = self._key(persona_id, prompt)
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,58 @@
+from typing import Any, Dict, List
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bounds for one batch-interaction request, which builds a crew per question x persona
+MAX_BATCH_QUESTIONS = 20
+MAX_BATCH_PERSONAS = 20
+
+
+class SimpleInteractionIn(BaseModel):
+    """Request body for /api/simple-interaction"""
+    question: str = Field(min_length=1)
+    personas: List[str] = Field(min_length=1)
+
+
+class BatchInteractionIn(BaseModel):
+    """Request body for /api/batch-interaction"""
+    questions: List[str] = Field(min_length=1, max_length=MAX_BATCH_QUESTIONS)
+    personas: List[str] = Field(min_length=1, max_length=MAX_BATCH_PERSONAS)
+
+
+class GroupDiscussionIn(BaseModel):
+    """Request body for /api/group-discussion"""
+    question: str = Field(min_length=1)
+    personas: List[str] = Field(min_length=1)
+    initial_reactions: List[Dict[str, Any]] = []
+
+
+class FocusGroupIn(BaseModel):
+    """Request body for /api/focus-group"""
+    campaign_description: str = Field(min_length=1)
+    personas: List[str] = Field(min_length=1)
+    goals: List[str] = []
+
+
+class FocusGroupRoundIn(BaseModel):
+    """Request body for /api/focus-group-round"""
+    campaign_description: str = Field(min_length=1)
+    personas: List[str] = Field(min_length=1)
+    round_number: int = 1
+    previous_messages: List[Dict[str, Any]] = []
+
+
+class PersonaIn(BaseModel):
+    """Request body for /save-persona; fields beyond name are saved as sent"""
+    model_config = ConfigDict(extra="allow")
+    name: str = "unknown"
+
+
+class CustomPersonaIn(BaseModel):
+    """Request body for /api/custom-persona"""
+    name: str = ""
+    role: str = ""
+    industry: str = ""
+    description: str = ""
+    avatar: str = "👤"
+    customAttributes: Dict[str, Any] = {}
+    motivations: List[Any] = []
+    behavioralTraits: List[Any] = []
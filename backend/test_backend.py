@@ -102,6 +102,39 @@ def test_simple_interaction():
         print(f"Error calling simple interaction: {e}")
         return {"endpoint": "/api/simple-interaction", "error": str(e)}
 
+def test_batch_interaction():
+    """Test the batch interaction endpoint"""
+    print("\n=== Testing Batch Interaction ===")
+    if not os.getenv("GEMINI_API_KEY"):
+        print("GEMINI_API_KEY not set, skipping this test")
+        return {"endpoint": "/api/batch-interaction", "skipped": "GEMINI_API_KEY not set"}
+    
+    payload = {
+        "questions": ["What do you think about AI?", "Would you pay for an AI assistant?"],
+        "personas": ["tech-enthusiast"]
+    }
+    
+    try:
+        response = requests.post(
+            f"{BASE_URL}/api/batch-interaction",
+            json=payload,
+            headers={"Content-Type": "application/json"}
+        )
+        data = response.json()
+        
+        print(f"Status Code: {response.status_code}")
+        print(f"Response: {json.dumps(data, indent=2)}")
+        
+        return {
+            "endpoint": "/api/batch-interaction",
+            "status_code": response.status_code,
+            "success": response.status_code == 200 and len(data.get("results", [])) == len(payload["questions"]),
+            "data": data
+        }
+    except Exception as e:
+        print(f"Error calling batch interaction: {e}")
+        return {"endpoint": "/api/batch-interaction", "error": str(e)}
+
 def test_focus_group():
     """Test the focus group simulation endpoint"""
     print("\n=== Testing Focus Group ===")
@@ -209,6 +242,7 @@ def run_all_tests():
     results.append(test_health_check())
     results.append(test_get_personas())
     results.append(test_simple_interaction())
+    results.append(test_batch_interaction())
     results.append(test_focus_group())
     results.append(test_custom_persona())
     